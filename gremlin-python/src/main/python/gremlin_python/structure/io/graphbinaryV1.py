@@ -19,15 +19,13 @@ under the License.
 
 import six
 import datetime
-import calendar
 import uuid
-import math
 import io
 import struct
-from collections import OrderedDict
+from functools import partial
+from math import isnan
 import logging
 
-from struct import pack, unpack
 from aenum import Enum
 from datetime import timedelta
 from gremlin_python import statics
@@ -43,9 +41,9 @@ from gremlin_python.structure.io.util import HashableDict
 log = logging.getLogger(__name__)
 
 # When we fall back to a superclass's serializer, we iterate over this map.
-# We want that iteration order to be consistent, so we use an OrderedDict,
-# not a dict.
-_serializers = OrderedDict()
+# We want that iteration order to be consistent, which a plain dict gives us
+# through insertion order while being much cheaper to copy for each writer.
+_serializers = {}
 _deserializers = {}
 
 
@@ -114,23 +112,40 @@ class DataType(Enum):
     custom = 0x00                 # todo
 
 
-NULL_BYTES = [DataType.null.value, 0x01]
+NULL_TYPE_CODE = DataType.null.value
+NULL_BYTES = bytes([NULL_TYPE_CODE, 0x01])
+# edges and vertex properties end with two nulls, one for the parent and one for the properties
+_DOUBLE_NULL_BYTES = NULL_BYTES * 2
 
 
-def _make_packer(format_string):
-    packer = struct.Struct(format_string)
+def _make_packer(packer):
     pack = packer.pack
     unpack = lambda s: packer.unpack(s)[0]
     return pack, unpack
 
 
-int64_pack, int64_unpack = _make_packer('>q')
-int32_pack, int32_unpack = _make_packer('>i')
-int8_pack, int8_unpack = _make_packer('>b')
-uint64_pack, uint64_unpack = _make_packer('>Q')
-uint8_pack, uint8_unpack = _make_packer('>B')
-float_pack, float_unpack = _make_packer('>f')
-double_pack, double_unpack = _make_packer('>d')
+# the hot read paths call the Struct unpack() directly to avoid the extra frame of the unpack lambdas
+int64_struct = struct.Struct('>q')
+int32_struct = struct.Struct('>i')
+int8_struct = struct.Struct('>b')
+uint64_struct = struct.Struct('>Q')
+uint8_struct = struct.Struct('>B')
+float_struct = struct.Struct('>f')
+double_struct = struct.Struct('>d')
+
+int64_pack, int64_unpack = _make_packer(int64_struct)
+int32_pack, int32_unpack = _make_packer(int32_struct)
+int8_pack, int8_unpack = _make_packer(int8_struct)
+uint64_pack, uint64_unpack = _make_packer(uint64_struct)
+uint8_pack, uint8_unpack = _make_packer(uint8_struct)
+float_pack, float_unpack = _make_packer(float_struct)
+double_pack, double_unpack = _make_packer(double_struct)
+
+
+def _make_typed_packer(graphbin_type, format_string):
+    # writes the type code and the not-null value flag along with the value in a single pack() call
+    packer = struct.Struct('>BB' + format_string.lstrip('>'))
+    return partial(packer.pack, graphbin_type.value, 0)
 
 
 class GraphBinaryTypeType(type):
@@ -141,14 +156,35 @@ class GraphBinaryTypeType(type):
                 _serializers[cls.python_type] = cls
             if cls.graphbinary_type:
                 _deserializers[cls.graphbinary_type] = cls
+            if isinstance(cls.python_type, type) and issubclass(cls.python_type, Enum):
+                mcs._build_enum_tables(cls)
         return cls
 
+    @staticmethod
+    def _build_enum_tables(cls):
+        # enums are small and closed so their serialized form is built once rather than on every write
+        cls.enum_value_bytes = {}
+        cls.enum_typed_bytes = {}
+        cls.enum_members = {}
+        for member in cls.python_type.__members__.values():
+            name = cls.unmangle_keyword(str(member.name))
+            value_bytes = bytes(StringIO.dictify(name, None, bytearray()))
+            cls.enum_value_bytes[member] = value_bytes
+            cls.enum_typed_bytes[member] = bytes(cls.prefix_bytes(cls.graphbinary_type)) + value_bytes
+            cls.enum_members.setdefault(name, member)
+
+        # an exact member name wins over an unmangled one, e.g. "id" is T.id and not T.id_
+        cls.enum_members.update(cls.python_type.__members__)
+
 
 class GraphBinaryWriter(object):
     def __init__(self, serializer_map=None):
         self.serializers = _serializers.copy()
         if serializer_map:
             self.serializers.update(serializer_map)
+        # serializer resolved for each concrete type seen so far, or False when none applies
+        self._dispatch = {}
+        self._serializer_types = tuple(self.serializers)
 
     def writeObject(self, objectData):
         return self.toDict(objectData)
@@ -158,16 +194,15 @@ class GraphBinaryWriter(object):
             to_extend = bytearray()
 
         if obj is None:
-            to_extend.extend(NULL_BYTES)
+            to_extend += NULL_BYTES
             return
 
-        try:
-            t = type(obj)
-            return self.serializers[t].dictify(obj, self, to_extend)
-        except KeyError:
-            for key, serializer in self.serializers.items():
-                if isinstance(obj, key):
-                    return serializer.dictify(obj, self, to_extend)
+        t = type(obj)
+        serializer = self._dispatch.get(t)
+        if serializer is None:
+            serializer = self._dispatch[t] = self._find_serializer(obj)
+        if serializer:
+            return serializer.dictify(obj, self, to_extend)
 
         if isinstance(obj, dict):
             return dict((self.toDict(k, to_extend), self.toDict(v, to_extend)) for k, v in obj.items())
@@ -178,27 +213,50 @@ class GraphBinaryWriter(object):
         else:
             return obj
 
+    def _find_serializer(self, obj):
+        serializer = self.serializers.get(type(obj))
+        if serializer is not None:
+            return serializer
+
+        # a single isinstance() against all the types rules out objects no serializer can handle
+        if not isinstance(obj, self._serializer_types):
+            return False
+
+        for key, serializer in self.serializers.items():
+            if isinstance(obj, key):
+                return serializer
+
+        return False
+
 
 class GraphBinaryReader(object):
     def __init__(self, deserializer_map=None):
         self.deserializers = _deserializers.copy()
         if deserializer_map:
             self.deserializers.update(deserializer_map)
+        # DataType is closed so the deserializers can be indexed directly by the type code
+        self._deserializers_by_code = [None] * 256
+        for data_type, deserializer in self.deserializers.items():
+            self._deserializers_by_code[data_type.value] = deserializer
 
     def readObject(self, b):
-        if isinstance(b, bytearray):
+        # BytesIO shares the memory of an immutable bytes rather than copying it, only a bytearray gets copied
+        if isinstance(b, (bytes, bytearray, memoryview)):
             return self.toObject(io.BytesIO(b))
         elif isinstance(b, io.BufferedIOBase):
             return self.toObject(b)
 
     def toObject(self, buff, data_type=None, nullable=True):
         if data_type is None:
-            bt = uint8_unpack(buff.read(1))
-            if bt == DataType.null.value:
+            bt = buff.read(1)[0]
+            if bt == NULL_TYPE_CODE:
                 if nullable:
                     buff.read(1)
                 return None
-            return self.deserializers[DataType(bt)].objectify(buff, self, nullable)
+            deserializer = self._deserializers_by_code[bt]
+            if deserializer is None:
+                raise ValueError("No deserializer found for GraphBinary type code %#04x" % bt)
+            return deserializer.objectify(buff, self, nullable)
         else:
             return self.deserializers[data_type].objectify(buff, self, nullable)
 
@@ -219,16 +277,16 @@ class _GraphBinaryTypeIO(object):
             to_extend = bytearray()
 
         if not as_value:
-            to_extend += uint8_pack(graphbin_type.value)
+            to_extend.append(graphbin_type.value)
 
         if nullable:
-            to_extend += int8_pack(0)
+            to_extend.append(0)
 
         return to_extend
 
     @classmethod
     def read_int(cls, buff):
-        return int32_unpack(buff.read(4))
+        return int32_struct.unpack(buff.read(4))[0]
 
     @classmethod
     def unmangle_keyword(cls, symbol):
@@ -251,19 +309,24 @@ class LongIO(_GraphBinaryTypeIO):
     graphbinary_type = DataType.long
     byte_format_pack = int64_pack
     byte_format_unpack = int64_unpack
+    typed_pack = _make_typed_packer(DataType.long, '>q')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
         if obj < -9223372036854775808 or obj > 9223372036854775807:
             raise Exception("TODO: don't forget bigint")
-        else:
+        elif as_value or not nullable:
             cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-            to_extend.extend(cls.byte_format_pack(obj))
-            return to_extend
+            to_extend += cls.byte_format_pack(obj)
+        else:
+            to_extend += cls.typed_pack(obj)
+        return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-            return cls.is_null(buff, reader, lambda b, r: int64_unpack(buff.read(8)), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return int64_struct.unpack(buff.read(8))[0]
 
 
 class IntIO(LongIO):
@@ -272,35 +335,43 @@ class IntIO(LongIO):
     graphbinary_type = DataType.int
     byte_format_pack = int32_pack
     byte_format_unpack = int32_unpack
+    typed_pack = _make_typed_packer(DataType.int, '>i')
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: cls.read_int(b), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return int32_struct.unpack(buff.read(4))[0]
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 
 
 class DateIO(_GraphBinaryTypeIO):
 
     python_type = datetime.datetime
     graphbinary_type = DataType.date
+    typed_pack = _make_typed_packer(DataType.date, '>q')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        try:
-            timestamp_seconds = calendar.timegm(obj.utctimetuple())
-            pts = timestamp_seconds * 1e3 + getattr(obj, 'microsecond', 0) / 1e3
-        except AttributeError:
-            pts = calendar.timegm(obj.timetuple()) * 1e3
-
-        ts = int(round(pts))
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        to_extend.extend(int64_pack(ts))
+        # naive datetimes are taken to be UTC
+        delta = obj - (_EPOCH if obj.utcoffset() is None else _EPOCH_UTC)
+        timestamp_seconds = delta.days * 86400 + delta.seconds
+        ts = int(round(timestamp_seconds * 1e3 + delta.microseconds / 1e3))
+        if as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += int64_pack(ts)
+        else:
+            to_extend += cls.typed_pack(ts)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader,
-                           lambda b, r: datetime.datetime.utcfromtimestamp(int64_unpack(b.read(8)) / 1000.0),
-                           nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return datetime.datetime.utcfromtimestamp(int64_struct.unpack(buff.read(8))[0] / 1000.0)
 
 
 # Based on current implementation, this class must always be declared before FloatIO.
@@ -308,24 +379,29 @@ class DateIO(_GraphBinaryTypeIO):
 class TimestampIO(_GraphBinaryTypeIO):
     python_type = statics.timestamp
     graphbinary_type = DataType.timestamp
+    typed_pack = _make_typed_packer(DataType.timestamp, '>q')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
         # Java timestamp expects milliseconds integer - Have to use int because of legacy Python
         ts = int(round(obj * 1000))
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        to_extend.extend(int64_pack(ts))
+        if as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += int64_pack(ts)
+        else:
+            to_extend += cls.typed_pack(ts)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
         # Python timestamp expects seconds
-        return cls.is_null(buff, reader, lambda b, r: statics.timestamp(int64_unpack(b.read(8)) / 1000.0),
-                           nullable)
+        return statics.timestamp(int64_struct.unpack(buff.read(8))[0] / 1000.0)
     
 
 def _long_bits_to_double(bits):
-    return unpack('d', pack('Q', bits))[0]
+    return double_unpack(uint64_pack(bits))
 
 
 NAN = _long_bits_to_double(0x7ff8000000000000)
@@ -340,27 +416,26 @@ class FloatIO(LongIO):
     graphbinary_base_type = DataType.float
     byte_format_pack = float_pack
     byte_format_unpack = float_unpack
+    typed_pack = _make_typed_packer(DataType.float, '>f')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        if math.isnan(obj):
-            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-            to_extend.extend(cls.byte_format_pack(NAN))
-        elif math.isinf(obj) and obj > 0:
-            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-            to_extend.extend(cls.byte_format_pack(POSITIVE_INFINITY))
-        elif math.isinf(obj) and obj < 0:
+        # infinities pack to their IEEE 754 form as they are but any NaN is written as the canonical one
+        if obj != obj:
+            obj = NAN
+
+        if as_value or not nullable:
             cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-            to_extend.extend(cls.byte_format_pack(NEGATIVE_INFINITY))
+            to_extend += cls.byte_format_pack(obj)
         else:
-            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-            to_extend.extend(cls.byte_format_pack(obj))
-
+            to_extend += cls.typed_pack(obj)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: float_unpack(b.read(4)), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return float_struct.unpack(buff.read(4))[0]
 
 
 class DoubleIO(FloatIO):
@@ -372,10 +447,13 @@ class DoubleIO(FloatIO):
     graphbinary_base_type = DataType.double
     byte_format_pack = double_pack
     byte_format_unpack = double_unpack
+    typed_pack = _make_typed_packer(DataType.double, '>d')
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: double_unpack(b.read(8)), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return double_struct.unpack(buff.read(8))[0]
 
 
 class CharIO(_GraphBinaryTypeIO):
@@ -390,7 +468,9 @@ class CharIO(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_char, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_char(buff, reader)
 
     @classmethod
     def _read_char(cls, b, r):
@@ -404,51 +484,99 @@ class CharIO(_GraphBinaryTypeIO):
                 x += b.read(1)
 
 
+_string_cache = {}
+
+
 class StringIO(_GraphBinaryTypeIO):
 
     python_type = str
     graphbinary_type = DataType.string
+    typed_pack = _make_typed_packer(DataType.string, '>i')
+    cache_max_length = 32
+    cache_max_size = 4096
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
         str_bytes = obj.encode("utf-8")
-        to_extend += int32_pack(len(str_bytes))
+        if as_value and not nullable:
+            # the bare form written for labels, keys, operators and step names which are always strings
+            to_extend += int32_pack(len(str_bytes))
+        elif as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += int32_pack(len(str_bytes))
+        else:
+            to_extend += cls.typed_pack(len(str_bytes))
         to_extend += str_bytes
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: b.read(cls.read_int(b)).decode("utf-8"), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        str_bytes = buff.read(int32_struct.unpack(buff.read(4))[0])
+        if len(str_bytes) > cls.cache_max_length:
+            return str_bytes.decode("utf-8")
+
+        # short strings like labels, keys and step names repeat constantly so hand back one shared instance
+        s = _string_cache.get(str_bytes)
+        if s is None:
+            s = str_bytes.decode("utf-8")
+            if len(_string_cache) < cls.cache_max_size:
+                _string_cache[str_bytes] = s
+        return s
 
 
 class ListIO(_GraphBinaryTypeIO):
 
     python_type = list
     graphbinary_type = DataType.list
+    homogeneous_min_size = 8
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
         cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        to_extend.extend(int32_pack(len(obj)))
+        to_extend += int32_pack(len(obj))
+        if len(obj) >= cls.homogeneous_min_size and cls._write_homogeneous(obj, writer, to_extend):
+            return to_extend
+
+        to_dict = writer.toDict
         for item in obj:
-            writer.toDict(item, to_extend)
+            to_dict(item, to_extend)
 
         return to_extend
 
+    @classmethod
+    def _write_homogeneous(cls, obj, writer, to_extend):
+        # items that are all of one fixed width type are packed in C without going through dispatch for each
+        item_types = set(map(type, obj))
+        if len(item_types) != 1:
+            return False
+
+        serializer = writer.serializers.get(item_types.pop())
+        if serializer not in _homogeneous_serializers:
+            return False
+
+        # NaN has to be written in its canonical form so leave that to FloatIO.dictify
+        if issubclass(serializer, FloatIO) and any(map(isnan, obj)):
+            return False
+
+        try:
+            to_extend += b"".join(map(serializer.typed_pack, obj))
+        except struct.error:
+            # out of range values take the regular path so they fail the same way
+            return False
+        return True
+
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_list, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_list(buff, reader)
 
     @classmethod
     def _read_list(cls, b, r):
-        size = cls.read_int(b)
-        the_list = []
-        while size > 0:
-            the_list.append(r.readObject(b))
-            size = size - 1
-
-        return the_list
+        read_object = r.toObject
+        return [read_object(b) for _ in range(cls.read_int(b))]
 
 
 class SetDeserializer(ListIO):
@@ -470,26 +598,30 @@ class MapIO(_GraphBinaryTypeIO):
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
         cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
 
-        to_extend.extend(int32_pack(len(obj)))
+        to_extend += int32_pack(len(obj))
+        to_dict = writer.toDict
         for k, v in obj.items():
-            writer.toDict(k, to_extend)
-            writer.toDict(v, to_extend)
+            to_dict(k, to_extend)
+            to_dict(v, to_extend)
 
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_map, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_map(buff, reader)
 
     @classmethod
     def _read_map(cls, b, r):
+        read_object = r.toObject
+        hashable = HashableDict.of
         size = cls.read_int(b)
         the_dict = {}
         while size > 0:
-            k = HashableDict.of(r.readObject(b))
-            v = r.readObject(b)
-            the_dict[k] = v
-            size = size - 1
+            k = hashable(read_object(b))
+            the_dict[k] = read_object(b)
+            size -= 1
 
         return the_dict
 
@@ -498,16 +630,22 @@ class UuidIO(_GraphBinaryTypeIO):
 
     python_type = uuid.UUID
     graphbinary_type = DataType.uuid
+    typed_pack = _make_typed_packer(DataType.uuid, '>16s')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        to_extend.extend(obj.bytes)
+        if as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += obj.bytes
+        else:
+            to_extend += cls.typed_pack(obj.bytes)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: uuid.UUID(bytes=b.read(16)), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return uuid.UUID(bytes=buff.read(16))
 
 
 class EdgeIO(_GraphBinaryTypeIO):
@@ -525,21 +663,22 @@ class EdgeIO(_GraphBinaryTypeIO):
         StringIO.dictify(obj.inV.label, writer, to_extend, True, False)
         writer.toDict(obj.outV.id, to_extend)
         StringIO.dictify(obj.outV.label, writer, to_extend, True, False)
-        to_extend.extend(NULL_BYTES)
-        to_extend.extend(NULL_BYTES)
+        to_extend += _DOUBLE_NULL_BYTES
 
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_edge, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_edge(buff, reader)
 
     @classmethod
     def _read_edge(cls, b, r):
-        edgeid = r.readObject(b)
+        edgeid = r.toObject(b)
         edgelbl = r.toObject(b, DataType.string, False)
-        inv = Vertex(r.readObject(b), r.toObject(b, DataType.string, False))
-        outv = Vertex(r.readObject(b), r.toObject(b, DataType.string, False))
+        inv = Vertex(r.toObject(b), r.toObject(b, DataType.string, False))
+        outv = Vertex(r.toObject(b), r.toObject(b, DataType.string, False))
         edge = Edge(edgeid, outv, edgelbl, inv)
         b.read(4)
         return edge
@@ -559,7 +698,9 @@ class PathIO(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: Path(r.readObject(b), r.readObject(b)), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return Path(reader.toObject(buff), reader.toObject(buff))
 
 
 class PropertyIO(_GraphBinaryTypeIO):
@@ -572,16 +713,18 @@ class PropertyIO(_GraphBinaryTypeIO):
         cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
         StringIO.dictify(obj.key, writer, to_extend, True, False)
         writer.toDict(obj.value, to_extend)
-        to_extend.extend(NULL_BYTES)
+        to_extend += NULL_BYTES
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_property, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_property(buff, reader)
 
     @classmethod
     def _read_property(cls, b, r):
-        p = Property(r.toObject(b, DataType.string, False), r.readObject(b), None)
+        p = Property(r.toObject(b, DataType.string, False), r.toObject(b), None)
         b.read(2)
         return p
 
@@ -610,16 +753,18 @@ class VertexIO(_GraphBinaryTypeIO):
         cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
         writer.toDict(obj.id, to_extend)
         StringIO.dictify(obj.label, writer, to_extend, True, False)
-        to_extend.extend(NULL_BYTES)
+        to_extend += NULL_BYTES
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_vertex, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_vertex(buff, reader)
 
     @classmethod
     def _read_vertex(cls, b, r):
-        vertex = Vertex(r.readObject(b), r.toObject(b, DataType.string, False))
+        vertex = Vertex(r.toObject(b), r.toObject(b, DataType.string, False))
         b.read(2)
         return vertex
 
@@ -635,17 +780,18 @@ class VertexPropertyIO(_GraphBinaryTypeIO):
         writer.toDict(obj.id, to_extend)
         StringIO.dictify(obj.label, writer, to_extend, True, False)
         writer.toDict(obj.value, to_extend)
-        to_extend.extend(NULL_BYTES)
-        to_extend.extend(NULL_BYTES)
+        to_extend += _DOUBLE_NULL_BYTES
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_vertexproperty, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_vertexproperty(buff, reader)
 
     @classmethod
     def _read_vertexproperty(cls, b, r):
-        vp = VertexProperty(r.readObject(b), r.toObject(b, DataType.string, False), r.readObject(b), None)
+        vp = VertexProperty(r.toObject(b), r.toObject(b, DataType.string, False), r.toObject(b), None)
         b.read(4)
         return vp
 
@@ -654,18 +800,23 @@ class _EnumIO(_GraphBinaryTypeIO):
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        StringIO.dictify(cls.unmangle_keyword(str(obj.name)), writer, to_extend)
+        if as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += cls.enum_value_bytes[obj]
+        else:
+            to_extend += cls.enum_typed_bytes[obj]
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_enumval, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_enumval(buff, reader)
 
     @classmethod
     def _read_enumval(cls, b, r):
         enum_name = r.toObject(b)
-        return cls.python_type[enum_name]
+        return cls.enum_members[enum_name]
 
 
 class BarrierIO(_EnumIO):
@@ -722,8 +873,9 @@ class BindingIO(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, lambda b, r: Binding(r.toObject(b, DataType.string, False),
-                                                              reader.readObject(b)), nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return Binding(reader.toObject(buff, DataType.string, False), reader.toObject(buff))
 
 
 class BytecodeIO(_GraphBinaryTypeIO):
@@ -734,59 +886,51 @@ class BytecodeIO(_GraphBinaryTypeIO):
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
         cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
         bc = obj.bytecode if isinstance(obj, Traversal) else obj
-        to_extend.extend(int32_pack(len(bc.step_instructions)))
+        to_dict = writer.toDict
+        to_extend += int32_pack(len(bc.step_instructions))
         for inst in bc.step_instructions:
-            inst_name, inst_args = inst[0], inst[1:] if len(inst) > 1 else []
-            StringIO.dictify(inst_name, writer, to_extend, True, False)
-            to_extend.extend(int32_pack(len(inst_args)))
-            for arg in inst_args:
-                writer.toDict(arg, to_extend)
+            StringIO.dictify(inst[0], writer, to_extend, True, False)
+            to_extend += int32_pack(len(inst) - 1)
+            for arg in inst[1:]:
+                to_dict(arg, to_extend)
 
-        to_extend.extend(int32_pack(len(bc.source_instructions)))
+        to_extend += int32_pack(len(bc.source_instructions))
         for inst in bc.source_instructions:
-            inst_name, inst_args = inst[0], inst[1:] if len(inst) > 1 else []
-            StringIO.dictify(inst_name, writer, to_extend, True, False)
-            to_extend.extend(int32_pack(len(inst_args)))
-            for arg in inst_args:
+            StringIO.dictify(inst[0], writer, to_extend, True, False)
+            to_extend += int32_pack(len(inst) - 1)
+            for arg in inst[1:]:
                 if isinstance(arg, TypeType):
-                    writer.toDict(GremlinType(arg().fqcn), to_extend)
+                    to_dict(GremlinType(arg().fqcn), to_extend)
                 else:
-                    writer.toDict(arg, to_extend)
+                    to_dict(arg, to_extend)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_bytecode, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_bytecode(buff, reader)
 
     @classmethod
     def _read_bytecode(cls, b, r):
         bytecode = Bytecode()
+        bytecode.step_instructions = cls._read_instructions(b, r)
+        bytecode.source_instructions = cls._read_instructions(b, r)
+        return bytecode
 
-        step_count = cls.read_int(b)
-        ix = 0
-        while ix < step_count:
-            inst = [r.toObject(b, DataType.string, False)]
-            inst_ct = cls.read_int(b)
-            iy = 0
-            while iy < inst_ct:
-                inst.append(r.readObject(b))
-                iy += 1
-            bytecode.step_instructions.append(inst)
-            ix += 1
-
-        source_count = cls.read_int(b)
-        ix = 0
-        while ix < source_count:
-            inst = [r.toObject(b, DataType.string, False)]
-            inst_ct = cls.read_int(b)
-            iy = 0
-            while iy < inst_ct:
-                inst.append(r.readObject(b))
-                iy += 1
-            bytecode.source_instructions.append(inst)
-            ix += 1
+    @classmethod
+    def _read_instructions(cls, b, r):
+        read_int = cls.read_int
+        read_object = r.toObject
+        instructions = []
+        size = read_int(b)
+        while size > 0:
+            inst = [read_object(b, DataType.string, False)]
+            inst += [read_object(b) for _ in range(read_int(b))]
+            instructions.append(inst)
+            size -= 1
 
-        return bytecode
+        return instructions
 
 
 class TraversalIO(BytecodeIO):
@@ -843,9 +987,10 @@ class PSerializer(_GraphBinaryTypeIO):
             args.append(obj.value)
             args.append(obj.other)
 
-        to_extend.extend(int32_pack(len(args)))
+        to_extend += int32_pack(len(args))
+        to_dict = writer.toDict
         for a in args:
-            writer.toDict(a, to_extend)
+            to_dict(a, to_extend)
 
         return to_extend
 
@@ -873,30 +1018,36 @@ class TraverserIO(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_traverser, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_traverser(buff, reader)
 
     @classmethod
     def _read_traverser(cls, b, r):
-        bulk = int64_unpack(b.read(8))
-        obj = r.readObject(b)
+        bulk = int64_struct.unpack(b.read(8))[0]
+        obj = r.toObject(b)
         return Traverser(obj, bulk=bulk)
 
 
 class ByteIO(_GraphBinaryTypeIO):
     python_type = SingleByte
     graphbinary_type = DataType.byte
+    typed_pack = _make_typed_packer(DataType.byte, '>b')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        to_extend.extend(int8_pack(obj))
+        if as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += int8_pack(obj)
+        else:
+            to_extend += cls.typed_pack(obj)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader,
-                           lambda b, r: int.__new__(SingleByte, int8_unpack(b.read(1))),
-                           nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return int.__new__(SingleByte, int8_struct.unpack(buff.read(1))[0])
 
 
 class ByteBufferIO(_GraphBinaryTypeIO):
@@ -912,7 +1063,9 @@ class ByteBufferIO(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_bytebuffer, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_bytebuffer(buff, reader)
 
     @classmethod
     def _read_bytebuffer(cls, b, r):
@@ -923,18 +1076,22 @@ class ByteBufferIO(_GraphBinaryTypeIO):
 class BooleanIO(_GraphBinaryTypeIO):
     python_type = bool
     graphbinary_type = DataType.boolean
+    typed_pack = _make_typed_packer(DataType.boolean, '>b')
 
     @classmethod
     def dictify(cls, obj, writer, to_extend, as_value=False, nullable=True):
-        cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
-        to_extend.extend(int8_pack(0x01 if obj else 0x00))
+        if as_value or not nullable:
+            cls.prefix_bytes(cls.graphbinary_type, as_value, nullable, to_extend)
+            to_extend += int8_pack(0x01 if obj else 0x00)
+        else:
+            to_extend += cls.typed_pack(0x01 if obj else 0x00)
         return to_extend
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader,
-                           lambda b, r: True if int8_unpack(b.read(1)) == 0x01 else False,
-                           nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return buff.read(1)[0] == 0x01
 
 
 class TextPSerializer(_GraphBinaryTypeIO):
@@ -957,9 +1114,10 @@ class TextPSerializer(_GraphBinaryTypeIO):
             args.append(obj.value)
             args.append(obj.other)
 
-        to_extend.extend(int32_pack(len(args)))
+        to_extend += int32_pack(len(args))
+        to_dict = writer.toDict
         for a in args:
-            writer.toDict(a, to_extend)
+            to_dict(a, to_extend)
 
         return to_extend
 
@@ -970,18 +1128,20 @@ class BulkSetDeserializer(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_bulkset, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_bulkset(buff, reader)
 
     @classmethod
     def _read_bulkset(cls, b, r):
+        read_object = r.toObject
+        read_long = int64_struct.unpack
         size = cls.read_int(b)
         the_list = []
         while size > 0:
-            itm = r.readObject(b)
-            bulk = int64_unpack(b.read(8))
-            for y in range(bulk):
-                the_list.append(itm)            
-            size = size - 1
+            itm = read_object(b)
+            the_list += [itm] * read_long(b.read(8))[0]
+            size -= 1
 
         return the_list
 
@@ -992,7 +1152,9 @@ class MetricsDeserializer(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_metrics, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_metrics(buff, reader)
 
     @classmethod
     def _read_metrics(cls, b, r):
@@ -1017,7 +1179,9 @@ class TraversalMetricsDeserializer(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_traversalmetrics, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_traversalmetrics(buff, reader)
 
     @classmethod
     def _read_traversalmetrics(cls, b, r):
@@ -1071,10 +1235,16 @@ class DurationIO(_GraphBinaryTypeIO):
 
     @classmethod
     def objectify(cls, buff, reader, nullable=True):
-        return cls.is_null(buff, reader, cls._read_duration, nullable)
+        if nullable and buff.read(1)[0] == 0x01:
+            return None
+        return cls._read_duration(buff, reader)
     
     @classmethod
     def _read_duration(cls, b, r):
         seconds = r.toObject(b, DataType.long, False)
         nanos = r.toObject(b, DataType.int, False)
         return timedelta(seconds=seconds, microseconds=nanos / 1000)
+
+
+# serializers whose fully qualified form is exactly their typed_pack() of the value
+_homogeneous_serializers = frozenset([IntIO, LongIO, FloatIO, DoubleIO, ByteIO, BooleanIO])
@@ -24,12 +24,26 @@ import math
 from gremlin_python.statics import timestamp, long, SingleByte, SingleChar, ByteBufferType
 from gremlin_python.structure.graph import Vertex, Edge, Property, VertexProperty, Path
 from gremlin_python.structure.io.graphbinaryV1 import GraphBinaryWriter, GraphBinaryReader
-from gremlin_python.process.traversal import Barrier, Binding, Bytecode
+from gremlin_python.process.traversal import Barrier, Binding, Bytecode, Cardinality, T
 
 
 class TestGraphBinaryReader(object):
     graphbinary_reader = GraphBinaryReader()
 
+    def test_bulkset(self):
+        # bulkset of size 2 holding "x" with a bulk of 3 and 100 with a bulk of 1
+        x = bytearray([0x2a, 0x00, 0x00, 0x00, 0x00, 0x02,
+                       0x03, 0x00, 0x00, 0x00, 0x00, 0x01, 0x78, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03,
+                       0x01, 0x00, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01])
+        output = self.graphbinary_reader.readObject(x)
+        assert ["x", "x", "x", 100] == output
+
+    def test_bytes_input(self):
+        # int of 100
+        x = bytes([0x01, 0x00, 0x00, 0x00, 0x00, 0x64])
+        assert 100 == self.graphbinary_reader.readObject(x)
+        assert 100 == self.graphbinary_reader.readObject(memoryview(x))
+
 
 class TestGraphSONWriter(object):
     graphbinary_writer = GraphBinaryWriter()
@@ -86,11 +100,38 @@ class TestGraphSONWriter(object):
         output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
         assert x == output
 
+        x = "serialize th\u00efs \u2603!"
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+
+    def test_repeated_string(self):
+        x = ["person", "person", "a much longer string that is not worth keeping around"] * 2
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+        assert output[0] is output[1]
+
     def test_homogeneous_list(self):
         x = ["serialize this!", "serialize that!", "serialize that!","stop telling me what to serialize"]
         output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
         assert x == output
 
+    def test_homogeneous_numeric_list(self):
+        x = list(range(-10, 10))
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+
+        x = [long(i) for i in range(20)]
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+
+        x = [i / 3.0 for i in range(20)] + [float('inf')]
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+
+        x = [True, False] * 10
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+
     def test_heterogeneous_list(self):
         x = ["serialize this!", 0, "serialize that!", "serialize that!", 1, "stop telling me what to serialize", 2]
         output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
@@ -211,3 +252,22 @@ class TestGraphSONWriter(object):
         x = datetime.timedelta(seconds=1000, microseconds=1000)
         output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
         assert x == output
+
+    def test_subclass_of_registered_type(self):
+        class MyDict(dict):
+            pass
+
+        x = MyDict(name="marko")
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert dict(name="marko") == output
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert dict(name="marko") == output
+
+    def test_enum_with_mangled_name(self):
+        x = Cardinality.list_
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output
+
+        x = T.id
+        output = self.graphbinary_reader.readObject(self.graphbinary_writer.writeObject(x))
+        assert x == output